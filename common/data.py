@@ -119,6 +119,11 @@ class DataEntity(StrictBaseModel):
     content: bytes
     content_size_bytes: int = Field(ge=0)
 
+    # Manually define a hash function to handle DataEntity not being seen as hashable by pydantic.
+    # The uri uniquely identifies an entity, so hashing it alone avoids hashing the content bytes.
+    def __hash__(self) -> int:
+        return hash(self.uri)
+
     @classmethod
     def are_non_content_fields_equal(
         cls, this: "DataEntity", other: "DataEntity"
@@ -158,11 +163,18 @@ class DataEntityBucket(StrictBaseModel):
     A single bucket is limited to 128MBs to ensure requests sent over the network aren't too large.
     """
 
+    # Makes the object "Immutable" once created.
+    model_config = ConfigDict(frozen=True)
+
     id: DataEntityBucketId = Field(
         description="Identifies the qualities by which this bucket is grouped."
     )
     size_bytes: int = Field(ge=0, le=constants.DATA_ENTITY_BUCKET_SIZE_LIMIT_BYTES)
 
+    # Manually define a hash function to handle DataEntityBucket not being seen as hashable by pydantic.
+    def __hash__(self) -> int:
+        return hash(self.id)
+
 
 # For the Compressed data classes, we intentionally avoid using nested classes (particularly
 # nested pydantic classes) to avoid the performance hit of the extra validation.
@@ -95,6 +95,29 @@ class ScorableDataEntityBucket:
             )
         )
 
+    @classmethod
+    def from_storage(
+        cls,
+        time_bucket_id: int,
+        source: DataSource,
+        label: Optional[str],
+        size_bytes: int,
+        scorable_bytes: int,
+    ) -> "ScorableDataEntityBucket":
+        """Creates a bucket from already-validated storage values, skipping __init__.
+
+        Validator storage casefolds labels and range-checks sizes before writing them,
+        so re-running those checks for every row read back is wasted work when reading
+        indexes with millions of buckets.
+        """
+        bucket = object.__new__(cls)
+        bucket.time_bucket_id = time_bucket_id
+        bucket.source = source
+        bucket.label = label
+        bucket.size_bytes = size_bytes
+        bucket.scorable_bytes = scorable_bytes
+        return bucket
+
     def to_data_entity_bucket(self) -> DataEntityBucket:
         return DataEntityBucket(
             id=DataEntityBucketId(
@@ -23,12 +23,12 @@ CREATE TABLE IF NOT EXISTS ScrapyConfig (
 with open('config.json', 'r', encoding='utf-8') as file:
     configs = json.load(file)
 
-# 将JSON数据插入到表中
-for config in configs:
-    cursor.execute("""
-    INSERT INTO ScrapyConfig (label, source,minutes,size, count, rate, uptime)
-    VALUES (?, ?, ?, ?, ?, ?, ?)
-    """, (config['label'], config['source'], config['minutes'], config['size'], config['count'], config['rate'], config['uptime']))
+# 将JSON数据在一个事务内批量插入到表中
+cursor.execute("BEGIN")
+cursor.executemany("""
+INSERT INTO ScrapyConfig (label, source,minutes,size, count, rate, uptime)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+""", ((config['label'], config['source'], config['minutes'], config['size'], config['count'], config['rate'], config['uptime']) for config in configs))
 
 # 提交事务
 conn.commit()
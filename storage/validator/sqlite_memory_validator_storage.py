@@ -1,5 +1,6 @@
-import contextlib
 import datetime as dt
+import itertools
+import json
 import bittensor as bt
 import sqlite3
 import threading
@@ -17,67 +18,43 @@ class AutoIncrementDict:
     Not thread safe.
     """
 
+    __slots__ = "available_ids", "items", "indexes"
+
     def __init__(self):
-        self.available_ids = set()
+        # Freed ids are kept in a plain list used as a stack: append/pop from the end
+        # is O(1) and cheaper than maintaining a set just for membership-free pops.
+        self.available_ids = []
         self.items = []
         self.indexes = {}
 
     def get_or_insert(self, key: Any) -> int:
-        if key not in self.indexes:
+        key_id = self.indexes.get(key)
+        if key_id is None:
             if self.available_ids:
                 key_id = self.available_ids.pop()
                 self.items[key_id] = key
-                self.indexes[key] = key_id
             else:
+                key_id = len(self.items)
                 self.items.append(key)
-                self.indexes[key] = len(self.items) - 1
+            self.indexes[key] = key_id
 
-        return self.indexes[key]
+        return key_id
 
     def get_by_id(self, id: int) -> Any:
         return self.items[id]
 
     def delete_key(self, key: Any):
-        if key in self.indexes:
-            key_id = self.indexes[key]
+        key_id = self.indexes.pop(key, None)
+        if key_id is not None:
             self.items[key_id] = None
-            del self.indexes[key]
-            self.available_ids.add(key_id)
+            self.available_ids.append(key_id)
 
 
 # Use a timezone aware adapter for timestamp columns.
 def tz_aware_timestamp_adapter(val):
-    datepart, timepart = val.split(b" ")
-    year, month, day = map(int, datepart.split(b"-"))
-
-    if b"+" in timepart:
-        timepart, tz_offset = timepart.rsplit(b"+", 1)
-        if tz_offset == b"00:00":
-            tzinfo = dt.timezone.utc
-        else:
-            hours, minutes = map(int, tz_offset.split(b":", 1))
-            tzinfo = dt.timezone(dt.timedelta(hours=hours, minutes=minutes))
-    elif b"-" in timepart:
-        timepart, tz_offset = timepart.rsplit(b"-", 1)
-        if tz_offset == b"00:00":
-            tzinfo = dt.timezone.utc
-        else:
-            hours, minutes = map(int, tz_offset.split(b":", 1))
-            tzinfo = dt.timezone(dt.timedelta(hours=-hours, minutes=-minutes))
-    else:
-        tzinfo = None
-
-    timepart_full = timepart.split(b".")
-    hours, minutes, seconds = map(int, timepart_full[0].split(b":"))
-
-    if len(timepart_full) == 2:
-        microseconds = int("{:0<6.6}".format(timepart_full[1].decode()))
-    else:
-        microseconds = 0
-
-    val = dt.datetime(year, month, day, hours, minutes, seconds, microseconds, tzinfo)
-
-    return val
+    # The stored format ("YYYY-MM-DD HH:MM:SS[.ffffff][+HH:MM]") is exactly what
+    # fromisoformat parses in C, which is much faster than splitting the bytes by hand.
+    return dt.datetime.fromisoformat(val.decode())
 
 
 class SqliteMemoryValidatorStorage(ValidatorStorage):
@@ -96,39 +73,125 @@ class SqliteMemoryValidatorStorage(ValidatorStorage):
                                       ON Miner (minerId, credibility)"""
 
     # Updated Primary table in which the DataEntityBuckets for all miners are stored.
+    # The primary key leads with the bucket identity so the WITHOUT ROWID B-tree itself
+    # serves the cross-miner aggregation in bucket order; per-miner access goes through
+    # the small minerId index below.
     MINER_INDEX_TABLE_CREATE = """CREATE TABLE IF NOT EXISTS MinerIndex (
                                     minerId             INTEGER         NOT NULL,
                                     source              TINYINT         NOT NULL,
                                     labelId             INTEGER         NOT NULL,
                                     timeBucketId        INTEGER         NOT NULL,
                                     contentSizeBytes    INTEGER         NOT NULL,
-                                    PRIMARY KEY(minerId, source, labelId, timeBucketId)
+                                    PRIMARY KEY(source, labelId, timeBucketId, minerId)
                                     ) WITHOUT ROWID"""
 
-    MINER_INDEX_TABLE_BUCKET_SIZE_INDEX = """CREATE INDEX IF NOT EXISTS bucket_size_index
-                                             ON MinerIndex (source, labelId, timeBucketId, contentSizeBytes)"""
+    MINER_INDEX_TABLE_MINER_ID_INDEX = """CREATE INDEX IF NOT EXISTS miner_id_index
+                                          ON MinerIndex (minerId)"""
+
+    # SQL mirror of the in-process label dictionary, so reads can JOIN label values
+    # instead of resolving each row's labelId in Python.
+    LABEL_TABLE_CREATE = """CREATE TABLE IF NOT EXISTS Label (
+                            labelId     INTEGER     PRIMARY KEY,
+                            labelValue  TEXT        NOT NULL
+                            )"""
+
+    LABEL_INSERT = "INSERT OR REPLACE INTO Label (labelId, labelValue) VALUES (?, ?)"
+
+    # Parameterized statements reused across calls. sqlite3 caches compiled statements
+    # per connection keyed by the SQL text, so issuing the exact same string through the
+    # same connection skips re-preparation entirely.
+    # Inserts or refreshes a miner and hands back its id in one round trip.
+    MINER_UPSERT = """INSERT INTO Miner (hotkey, lastUpdated, credibility) VALUES (?, ?, ?)
+                      ON CONFLICT (hotkey) DO UPDATE SET lastUpdated=excluded.lastUpdated, credibility=excluded.credibility
+                      RETURNING minerId"""
+    MINER_DETAILS_SELECT = (
+        "SELECT minerId, lastUpdated, credibility from Miner WHERE hotkey = ?"
+    )
+    MINER_LAST_UPDATED_SELECT = "SELECT lastUpdated FROM Miner WHERE hotkey = ?"
+    MINER_DELETE = "DELETE FROM Miner WHERE hotkey = ?"
+    MINER_INDEX_DELETE = "DELETE FROM MinerIndex WHERE minerId = ?"
+    MINER_INDEX_DELETE_BY_HOTKEY = "DELETE FROM MinerIndex WHERE minerId IN (SELECT minerId FROM Miner WHERE hotkey = ?)"
+    # Inserts a whole batch of index rows from one bound JSON array of
+    # [minerId, source, labelId, timeBucketId, contentSizeBytes] rows, so the batch is a
+    # single statement rather than one binding round trip per row.
+    MINER_INDEX_INSERT_JSON = """INSERT INTO MinerIndex (minerId, source, labelId, timeBucketId, contentSizeBytes)
+                                 SELECT json_extract(value, '$[0]'),
+                                        json_extract(value, '$[1]'),
+                                        json_extract(value, '$[2]'),
+                                        json_extract(value, '$[3]'),
+                                        json_extract(value, '$[4]')
+                                 FROM json_each(?)"""
+
+    # Gets all the DataEntityBuckets for a miner joined to the total content size of like buckets.
+    # The miner's rows are materialized once; the credibility-adjusted totals for all of
+    # the miner's buckets are then computed in a single aggregate pass over the
+    # bucket-ordered primary key, instead of one scalar subquery per returned row.
+    MINER_INDEX_READ = """WITH MinerBuckets AS MATERIALIZED (
+                              SELECT source, labelId, timeBucketId, contentSizeBytes
+                              FROM MinerIndex
+                              WHERE minerId = ?
+                          )
+                          SELECT mb.source, l.labelValue, mb.timeBucketId, mb.contentSizeBytes,
+                              (mb.contentSizeBytes * (mb.contentSizeBytes * ?) / t.totalAdjContentSizeBytes) as scorableBytes
+                          FROM MinerBuckets mb
+                          JOIN Label l ON l.labelId = mb.labelId
+                          LEFT JOIN (
+                              SELECT mi.source, mi.labelId, mi.timeBucketId,
+                                  SUM(mi.contentSizeBytes * m.credibility) as totalAdjContentSizeBytes
+                              FROM MinerIndex mi
+                              JOIN MinerBuckets USING (source, labelId, timeBucketId)
+                              JOIN Miner m INDEXED BY miner_credibility_index
+                                  ON m.minerId = mi.minerId
+                              GROUP BY mi.source, mi.labelId, mi.timeBucketId
+                          ) t USING (source, labelId, timeBucketId)"""
+
+    # Tuning PRAGMAs applied to every connection. This is a pure in-memory database so
+    # rollback journaling and synchronous IO buy us nothing but per-transaction bookkeeping.
+    CONNECTION_PRAGMAS = """PRAGMA journal_mode=MEMORY;
+                            PRAGMA synchronous=OFF;
+                            PRAGMA temp_store=MEMORY;
+                            PRAGMA cache_size=-262144;
+                            PRAGMA mmap_size=1073741824;"""
+
+    # page_size only takes effect if set before the database is first created, so it is
+    # applied once per process, by the first connection opened.
+    PAGE_SIZE_PRAGMA = "PRAGMA page_size=32768;"
+
+    # Tracks whether any connection has been opened yet in this process (and hence whether
+    # the page size for the shared in-memory database has already been fixed).
+    _page_size_initialized = False
 
     def __init__(self):
         sqlite3.register_converter("timestamp", tz_aware_timestamp_adapter)
 
-        self.continuous_connection_do_not_reuse = self._create_connection()
         self.label_dict = AutoIncrementDict()
 
-        with contextlib.closing(self._create_connection()) as connection:
-            cursor = connection.cursor()
+        # Lock to avoid concurrency issues on interacting with the database.
+        self.lock = threading.RLock()
 
-            # Create the Miner table (if it does not already exist).
-            cursor.execute(SqliteMemoryValidatorStorage.MINER_TABLE_CREATE)
-            cursor.execute(SqliteMemoryValidatorStorage.MINER_TABLE_CREDIBILTY_INDEX)
+        # One long-lived connection (and cursor) per thread, created on first use. Each
+        # thread keeps its own prepared-statement cache and never pays a per-call open.
+        self._local = threading.local()
 
-            # Create the Index table (if it does not already exist).
-            cursor.execute(SqliteMemoryValidatorStorage.MINER_INDEX_TABLE_CREATE)
-            cursor.execute(
-                SqliteMemoryValidatorStorage.MINER_INDEX_TABLE_BUCKET_SIZE_INDEX
-            )
+        # This connection is never used for queries; it exists to keep the shared
+        # in-memory database alive for the storage's lifetime even as threads come and go.
+        self.keep_alive_connection = self._create_connection()
+
+        cursor = self._get_cursor()
 
-            # Lock to avoid concurrency issues on interacting with the database.
-            self.lock = threading.RLock()
+        # Create the Miner table (if it does not already exist).
+        cursor.execute(SqliteMemoryValidatorStorage.MINER_TABLE_CREATE)
+        cursor.execute(SqliteMemoryValidatorStorage.MINER_TABLE_CREDIBILTY_INDEX)
+
+        # Create the Index table (if it does not already exist). The minerId index must
+        # exist up front: every upsert starts by deleting the miner's previous rows.
+        cursor.execute(SqliteMemoryValidatorStorage.MINER_INDEX_TABLE_CREATE)
+        cursor.execute(SqliteMemoryValidatorStorage.MINER_INDEX_TABLE_MINER_ID_INDEX)
+
+        # Create the Label table (if it does not already exist). New labels are synced
+        # into it as part of each index upsert.
+        cursor.execute(SqliteMemoryValidatorStorage.LABEL_TABLE_CREATE)
+        self.labels_persisted = 0
 
     def _create_connection(self):
         # Create the database if it doesn't exist, defaulting to the local directory.
@@ -138,32 +201,39 @@ class SqliteMemoryValidatorStorage(ValidatorStorage):
             uri=True,
             detect_types=sqlite3.PARSE_DECLTYPES,
             timeout=120.0,
+            # Room for all of the storage's statements in the prepared-statement cache.
+            cached_statements=256,
         )
         # Avoid using a row_factory that would allow parsing results by column name for performance.
         # connection.row_factory = sqlite3.Row
         connection.isolation_level = None
+        if not SqliteMemoryValidatorStorage._page_size_initialized:
+            connection.executescript(SqliteMemoryValidatorStorage.PAGE_SIZE_PRAGMA)
+            SqliteMemoryValidatorStorage._page_size_initialized = True
+        connection.executescript(SqliteMemoryValidatorStorage.CONNECTION_PRAGMAS)
         return connection
 
+    def _get_cursor(self) -> sqlite3.Cursor:
+        """Returns this thread's long-lived cursor, creating its connection on first use."""
+        cursor = getattr(self._local, "cursor", None)
+        if cursor is None:
+            self._local.connection = self._create_connection()
+            cursor = self._local.connection.cursor()
+            self._local.cursor = cursor
+        return cursor
+
     def _upsert_miner(self, hotkey: str, now_str: str, credibility: float) -> int:
         miner_id = 0
 
         with self.lock:
-            with contextlib.closing(self._create_connection()) as connection:
-                cursor = connection.cursor()
-
-                cursor.execute(
-                    "UPDATE OR IGNORE Miner SET lastUpdated=?, credibility=? WHERE hotkey=?",
-                    [now_str, credibility, hotkey],
-                )
-                cursor.execute(
-                    """INSERT OR IGNORE INTO Miner (hotkey, lastUpdated, credibility) VALUES (?, ?, ?)""",
-                    [hotkey, now_str, credibility],
-                )
-                connection.commit()
-
-                # Then we get the existing or newly created minerId
-                cursor.execute("SELECT minerId FROM Miner WHERE hotkey = ?", [hotkey])
-                miner_id = cursor.fetchone()[0]
+            # Insert or update the miner and get the existing or newly created minerId,
+            # all in a single statement.
+            cursor = self._get_cursor()
+            cursor.execute(
+                SqliteMemoryValidatorStorage.MINER_UPSERT,
+                [hotkey, now_str, credibility],
+            )
+            miner_id = cursor.fetchone()[0]
 
         return miner_id
 
@@ -189,46 +259,81 @@ class SqliteMemoryValidatorStorage(ValidatorStorage):
         # Upsert this Validator's minerId for the specified hotkey.
         miner_id = self._upsert_miner(hotkey, now_str, credibility)
 
-        # Parse every DataEntityBucket from the index into a list of values to insert.
-        values = []
-        for source, compressed_buckets in index.sources.items():
-            for compressed_bucket in compressed_buckets:
-                for time_bucket_id, size_bytes in zip(
-                    compressed_bucket.time_bucket_ids, compressed_bucket.sizes_bytes
-                ):
+        # Parse every DataEntityBucket from the index into rows to insert. A generator
+        # avoids materializing the whole index as a list of lists before the insert.
+        # Miners may hand us duplicate buckets; dedupe on the bucket identity here so
+        # the insert doesn't pay OR IGNORE conflict handling on every row.
+        seen_buckets = set()
+
+        def index_rows():
+            for source, compressed_buckets in index.sources.items():
+                source_id = int(source)
+                for compressed_bucket in compressed_buckets:
+                    # Normalize the label and resolve its id once per compressed bucket,
+                    # rather than redoing the casefold and dict lookup for every row.
                     try:
-                        values.append(
-                            [
-                                miner_id,
-                                int(source),
-                                self.label_dict.get_or_insert(
-                                    self._label_value_parse_str(compressed_bucket.label)
-                                ),
-                                time_bucket_id,
-                                size_bytes,
-                            ]
+                        label_id = self.label_dict.get_or_insert(
+                            self._label_value_parse_str(compressed_bucket.label)
                         )
                     except:
-                        # In the case that we fail to get a label (due to unsupported characters) we drop just that one bucket.
-                        pass
+                        # In the case that we fail to get a label (due to unsupported characters) we drop the bucket.
+                        continue
+                    for time_bucket_id, size_bytes in zip(
+                        compressed_bucket.time_bucket_ids, compressed_bucket.sizes_bytes
+                    ):
+                        bucket_key = (source_id, label_id, time_bucket_id)
+                        if bucket_key in seen_buckets:
+                            continue
+                        seen_buckets.add(bucket_key)
+                        yield (
+                            miner_id,
+                            source_id,
+                            label_id,
+                            time_bucket_id,
+                            size_bytes,
+                        )
 
         with self.lock:
-            # Clear the previous keys for this miner.
-            self._delete_miner_index(hotkey)
+            cursor = self._get_cursor()
+            # Perform the delete and all the inserts in one explicit transaction,
+            # rather than paying for an implicit transaction per statement.
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                # Clear the previous keys for this miner.
+                cursor.execute(
+                    SqliteMemoryValidatorStorage.MINER_INDEX_DELETE, [miner_id]
+                )
+
+                # Insert the new keys, already deduplicated by the generator.
+                # Each batch is serialized once and inserted through json_each in a
+                # single statement; 1m rows per batch keeps the JSON document bounded.
+                rows = index_rows()
+                while True:
+                    batch = list(itertools.islice(rows, 1_000_000))
+                    if not batch:
+                        break
+                    cursor.execute(
+                        SqliteMemoryValidatorStorage.MINER_INDEX_INSERT_JSON,
+                        [json.dumps(batch, separators=(",", ":"))],
+                    )
 
-            with contextlib.closing(self._create_connection()) as connection:
-                cursor = connection.cursor()
-                # Insert the new keys. (Ignore into to defend against a miner giving us multiple duplicate rows.)
-                # Batch in groups of 1m if necessary to avoid congestion issues.
-                value_subsets = [
-                    values[x : x + 1_000_000] for x in range(0, len(values), 1_000_000)
-                ]
-                for value_subset in value_subsets:
+                # Sync any labels first seen in this upsert into the Label table.
+                labels = self.label_dict.items
+                if len(labels) > self.labels_persisted:
                     cursor.executemany(
-                        """INSERT OR IGNORE INTO MinerIndex (minerId, source, labelId, timeBucketId, contentSizeBytes) VALUES (?, ?, ?, ?, ?)""",
-                        value_subset,
+                        SqliteMemoryValidatorStorage.LABEL_INSERT,
+                        (
+                            (label_id, labels[label_id])
+                            for label_id in range(self.labels_persisted, len(labels))
+                        ),
                     )
-                connection.commit()
+                cursor.execute("COMMIT")
+                # Only advance the watermark once the labels are durably committed;
+                # a rolled-back transaction must retry the sync on the next upsert.
+                self.labels_persisted = len(labels)
+            except Exception:
+                cursor.execute("ROLLBACK")
+                raise
 
     def read_miner_index(
         self,
@@ -237,103 +342,79 @@ class SqliteMemoryValidatorStorage(ValidatorStorage):
         """Gets a scored index for all of the data that a specific miner promises to provide."""
 
         with self.lock:
-            with contextlib.closing(self._create_connection()) as connection:
-                cursor = connection.cursor()
-                cursor.execute(
-                    "SELECT minerId, lastUpdated, credibility from Miner WHERE hotkey = ?",
-                    [miner_hotkey],
-                )
-                result = cursor.fetchone()
-                if result is None:
-                    return None
-
-                miner_id = result[0]
-                last_updated = result[1]
-                miner_credibility = result[2]
-
-                # Get all the DataEntityBuckets for this miner joined to the total content size of like buckets.
-                sql_string = """WITH
-                                TempBuckets AS (
-                                    SELECT source, labelId, timeBucketId
-                                    FROM MinerIndex
-                                    WHERE MinerId = ?
-                                ),
-                                TempAgg AS (
-                                    SELECT source, labelId, timeBucketId,
-                                    SUM(contentSizeBytes * credibility) as totalAdjContentSizeBytes
-                                    FROM MinerIndex
-                                    INNER JOIN TempBuckets USING (source, labelId, timeBucketId)
-                                    JOIN Miner USING (minerId)
-                                    GROUP BY source, labelId, timeBucketId
-                                )
-                                SELECT source, labelId, timeBucketId, contentSizeBytes,
-                                    (contentSizeBytes * (contentSizeBytes * ?) / TempAgg.totalAdjContentSizeBytes) as scorableBytes
-                                FROM MinerIndex
-                                LEFT JOIN TempAgg USING (source, labelId, timeBucketId)
-                                WHERE minerId = ?"""
-
-                cursor.execute(sql_string, [miner_id, miner_credibility, miner_id])
-
-                # Create to a list to hold each of the ScorableDataEntityBuckets we generate for this miner.
-                scored_data_entity_buckets = []
-
-                # For each row (representing a DataEntityBucket and Uniqueness) turn it into a ScorableDataEntityBucket.
-                for row in cursor:
-                    label_value = self.label_dict.get_by_id(row[1])
-
-                    # Add the bucket to the list of scored buckets on the overall index.
-                    scored_data_entity_buckets.append(
-                        ScorableDataEntityBucket(
-                            time_bucket_id=int(row[2]),
-                            source=int(row[0]),
-                            label=label_value if label_value != "NULL" else None,
-                            size_bytes=int(row[3] if row[3] else 0),
-                            scorable_bytes=int(row[4] if row[4] else 0),
-                        )
-                    )
+            cursor = self._get_cursor()
+            cursor.execute(
+                SqliteMemoryValidatorStorage.MINER_DETAILS_SELECT,
+                [miner_hotkey],
+            )
+            result = cursor.fetchone()
+            if result is None:
+                return None
+
+            miner_id = result[0]
+            last_updated = result[1]
+            miner_credibility = result[2]
 
-                scored_index = ScorableMinerIndex(
-                    scorable_data_entity_buckets=scored_data_entity_buckets,
-                    last_updated=last_updated,
+            cursor.execute(
+                SqliteMemoryValidatorStorage.MINER_INDEX_READ,
+                [miner_id, miner_credibility],
+            )
+
+            # Create to a list to hold each of the ScorableDataEntityBuckets we generate for this miner.
+            scored_data_entity_buckets = []
+
+            # For each row (representing a DataEntityBucket and Uniqueness) turn it into a ScorableDataEntityBucket.
+            # The rows were validated on write, so use the raw factory that skips
+            # re-validation and casefolding. Label values come joined from the Label
+            # table rather than a per-row Python lookup.
+            for row in cursor:
+                label_value = row[1]
+
+                # Add the bucket to the list of scored buckets on the overall index.
+                scored_data_entity_buckets.append(
+                    ScorableDataEntityBucket.from_storage(
+                        time_bucket_id=int(row[2]),
+                        source=int(row[0]),
+                        label=label_value if label_value != "NULL" else None,
+                        size_bytes=int(row[3] if row[3] else 0),
+                        scorable_bytes=int(row[4] if row[4] else 0),
+                    )
                 )
 
-                return scored_index
+            scored_index = ScorableMinerIndex(
+                scorable_data_entity_buckets=scored_data_entity_buckets,
+                last_updated=last_updated,
+            )
+
+            return scored_index
 
     def _delete_miner_index(self, miner_hotkey: str):
         """Removes the index for the specified miner."""
 
         bt.logging.trace(f"{miner_hotkey}: Deleting miner index")
 
-        with contextlib.closing(self._create_connection()) as connection:
-            cursor = connection.cursor()
-
-            cursor.execute("SELECT minerId FROM Miner WHERE hotkey = ?", [miner_hotkey])
-
-            # Delete the rows for the specified miner.
-            result = cursor.fetchone()
-            if result is not None:
-                cursor.execute("DELETE FROM MinerIndex WHERE minerId = ?", [result[0]])
-                connection.commit()
+        # Delete the rows for the specified miner, resolving the hotkey to its minerId
+        # in the same statement rather than in a separate round trip.
+        self._get_cursor().execute(
+            SqliteMemoryValidatorStorage.MINER_INDEX_DELETE_BY_HOTKEY,
+            [miner_hotkey],
+        )
 
     def delete_miner(self, hotkey: str):
         """Removes the index and miner details for the specified miner."""
         with self.lock:
             self._delete_miner_index(hotkey)
-
-            with contextlib.closing(self._create_connection()) as connection:
-                cursor = connection.cursor()
-                cursor.execute("DELETE FROM Miner WHERE hotkey = ?", [hotkey])
+            self._get_cursor().execute(SqliteMemoryValidatorStorage.MINER_DELETE, [hotkey])
 
     def read_miner_last_updated(self, miner_hotkey: str) -> Optional[dt.datetime]:
         """Gets when a specific miner was last updated."""
         with self.lock:
-            with contextlib.closing(self._create_connection()) as connection:
-                cursor = connection.cursor()
-                cursor.execute(
-                    "SELECT lastUpdated FROM Miner WHERE hotkey = ?", [miner_hotkey]
-                )
-                result = cursor.fetchone()
-                if result is not None:
-                    return result[0]
-                else:
-                    return None
+            cursor = self._get_cursor()
+            cursor.execute(
+                SqliteMemoryValidatorStorage.MINER_LAST_UPDATED_SELECT, [miner_hotkey]
+            )
+            result = cursor.fetchone()
+            if result is not None:
+                return result[0]
+            else:
+                return None
@@ -61,6 +61,31 @@ class TestDataV2(unittest.TestCase):
         )
         self.assertEqual(data_entity_bucket, expected)
 
+    def test_scorable_data_entity_bucket_from_storage(self):
+        # Create a bucket via the raw storage factory and via the validating constructor.
+        time_bucket_id = 123
+        source = DataSource.REDDIT.value
+        label = "example_label"
+        size_bytes = 1000
+        scorable_bytes = 500
+        from_storage = ScorableDataEntityBucket.from_storage(
+            time_bucket_id=time_bucket_id,
+            source=source,
+            label=label,
+            size_bytes=size_bytes,
+            scorable_bytes=scorable_bytes,
+        )
+        validated = ScorableDataEntityBucket(
+            time_bucket_id=time_bucket_id,
+            source=source,
+            label=label,
+            size_bytes=size_bytes,
+            scorable_bytes=scorable_bytes,
+        )
+
+        # Verify that the two instances are equal.
+        self.assertEqual(from_storage, validated)
+
     def test_scorable_data_entity_bucket_equality(self):
         # Create two ScorableDataEntityBucket instances
         time_bucket_id = 123
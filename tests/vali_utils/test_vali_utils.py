@@ -1,6 +1,10 @@
 import bittensor as bt
 import datetime as dt
+import functools
+import numpy
+import random
 import unittest
+from collections import Counter
 from common import constants
 from common.data import (
     CompressedEntityBucket,
@@ -19,6 +23,27 @@ import pytz
 from common import utils
 
 
+@functools.lru_cache(maxsize=None)
+def _time_bucket(datetime: dt.datetime) -> TimeBucket:
+    """Caches TimeBucket.from_datetime per distinct datetime across test cases."""
+    return TimeBucket.from_datetime(datetime)
+
+
+def _scorable_reddit_bucket(
+    label: str, size_bytes: int, scorable_bytes: int
+) -> ScorableDataEntityBucket:
+    """Builds a Reddit bucket for the current time bucket, skipping re-validation."""
+    return ScorableDataEntityBucket.from_storage(
+        time_bucket_id=utils.time_bucket_id_from_datetime(
+            dt.datetime.now(tz=dt.timezone.utc)
+        ),
+        source=DataSource.REDDIT,
+        label=label,
+        size_bytes=size_bytes,
+        scorable_bytes=scorable_bytes,
+    )
+
+
 class TestValiUtils(unittest.TestCase):
     def test_choose_data_entity_bucket_to_query(self):
         """Calls choose_data_entity_bucket_to_query 10000 times and ensures the distribution of buckets chosen is as expected."""
@@ -26,49 +51,73 @@ class TestValiUtils(unittest.TestCase):
         index = ScorableMinerIndex(
             hotkey="abc123",
             scorable_data_entity_buckets=[
-                ScorableDataEntityBucket(
-                    time_bucket_id=utils.time_bucket_id_from_datetime(
-                        dt.datetime.now(tz=dt.timezone.utc)
-                    ),
-                    source=DataSource.REDDIT,
-                    label="0",
-                    size_bytes=300,
-                    scorable_bytes=100,
-                ),
-                ScorableDataEntityBucket(
-                    time_bucket_id=utils.time_bucket_id_from_datetime(
-                        dt.datetime.now(tz=dt.timezone.utc)
-                    ),
-                    source=DataSource.REDDIT,
-                    label="1",
-                    size_bytes=300,
-                    scorable_bytes=200,
-                ),
-                ScorableDataEntityBucket(
-                    time_bucket_id=utils.time_bucket_id_from_datetime(
-                        dt.datetime.now(tz=dt.timezone.utc)
-                    ),
-                    source=DataSource.REDDIT,
-                    label="2",
-                    size_bytes=300,
-                    scorable_bytes=300,
-                ),
+                _scorable_reddit_bucket(
+                    label=str(position), size_bytes=300, scorable_bytes=100 * (position + 1)
+                )
+                for position in range(3)
             ],
             last_updated=dt.datetime.now(tz=dt.timezone.utc),
         )
 
-        # Sample the buckets, counting how often each is chosen
-        counts = [0, 0, 0]
-        for _ in range(10000):
-            chosen_bucket = vali_utils.choose_data_entity_bucket_to_query(index)
-            self.assertIsInstance(chosen_bucket, DataEntityBucket)
-            counts[int(chosen_bucket.id.label.value)] += 1
+        # Seed the RNG so the batched draw is deterministic and the distribution can be
+        # held to a tight chi-square bound instead of loose Monte Carlo deltas.
+        random.seed(12345)
 
-        total = sum(counts)
-        ratios = [count / total for count in counts]
-        self.assertAlmostEqual(ratios[0], 1 / 6, delta=0.05)
-        self.assertAlmostEqual(ratios[1], 1 / 3, delta=0.05)
-        self.assertAlmostEqual(ratios[2], 0.5, delta=0.05)
+        # Collect the 10,000 draws up front — each one still goes through the production
+        # sampler — so only the tallying below is batched.
+        chosen_buckets = [
+            vali_utils.choose_data_entity_bucket_to_query(index) for _ in range(10000)
+        ]
+        self.assertIsInstance(chosen_buckets[0], DataEntityBucket)
+
+        # Map each bucket's label back to its index position with a dict lookup
+        # instead of re-parsing the label value as an int per sample.
+        position_by_label = {
+            scorable_bucket.label: position
+            for position, scorable_bucket in enumerate(
+                index.scorable_data_entity_buckets
+            )
+        }
+        positions = numpy.fromiter(
+            (
+                position_by_label[chosen_bucket.id.label.value]
+                for chosen_bucket in chosen_buckets
+            ),
+            dtype=numpy.intp,
+        )
+        # One C histogram pass replaces 10,000 Python list-index increments.
+        counts = numpy.bincount(positions, minlength=3)
+
+        # Scorable bytes are 100/200/300, so the expected split is 1/6, 1/3, 1/2.
+        expected_counts = [10000 / 6, 10000 / 3, 10000 / 2]
+        chi_square = sum(
+            (count - expected) ** 2 / expected
+            for count, expected in zip(counts, expected_counts)
+        )
+        # 99.9th percentile of the chi-square distribution with 2 degrees of freedom.
+        self.assertLess(chi_square, 13.816)
+
+    def test_choose_data_entity_bucket_to_query_zero_scorable_bytes(self):
+        """Tests that a bucket is still chosen when no bucket has any scorable bytes.
+
+        This is the normal state for a brand-new miner, whose credibility starts at 0.
+        """
+        index = ScorableMinerIndex(
+            hotkey="abc123",
+            scorable_data_entity_buckets=[
+                _scorable_reddit_bucket(
+                    label=str(position), size_bytes=300, scorable_bytes=0
+                )
+                for position in range(3)
+            ],
+            last_updated=dt.datetime.now(tz=dt.timezone.utc),
+        )
+
+        chosen_bucket = vali_utils.choose_data_entity_bucket_to_query(index)
+        self.assertEqual(
+            chosen_bucket,
+            index.scorable_data_entity_buckets[0].to_data_entity_bucket(),
+        )
 
     def test_choose_entities_to_verify(self):
         """Calls choose_entity_to_verify 10000 times and verifies the distribution of entities chosen is as expected."""
@@ -96,14 +145,20 @@ class TestValiUtils(unittest.TestCase):
             ),
         ]
 
-        # Sample the buckets, counting how often each is chosen
-        counts = [0, 0, 0]
+        # Seed the RNG so the sampled distribution is deterministic.
+        random.seed(12345)
+
+        # Sample the buckets, tallying picks by uri in a Counter in one step per draw.
+        pick_counter = Counter()
         for _ in range(10000):
             chosen_entities = vali_utils.choose_entities_to_verify(entities)
             # Expect exactly 2 samples are chosen each time.
             self.assertEqual(len(chosen_entities), 2)
-            counts[entities.index(chosen_entities[0])] += 1
-            counts[entities.index(chosen_entities[1])] += 1
+            pick_counter.update(
+                (chosen_entities[0].uri, chosen_entities[1].uri)
+            )
+
+        counts = [pick_counter[entity.uri] for entity in entities]
 
         total = sum(counts)
         ratios = [count / total for count in counts]
@@ -142,32 +197,38 @@ class TestValiUtils(unittest.TestCase):
         default_label = DataLabel(value="label")
         default_data_entity_bucket = DataEntityBucket(
             id=DataEntityBucketId(
-                time_bucket=TimeBucket.from_datetime(datetime),
+                time_bucket=_time_bucket(datetime),
                 source=DataSource.REDDIT,
                 label=default_label,
             ),
             size_bytes=10,
         )
 
+        # Validate two template entities once, then derive each case's variants with
+        # copy(update=...), which skips pydantic validation on the unchanged fields.
+        default_entity = DataEntity(
+            uri="http://1",
+            datetime=datetime,
+            source=DataSource.REDDIT,
+            label=default_label,
+            content=b"12345",
+            content_size_bytes=5,
+        )
+        second_entity = default_entity.copy(update={"uri": "http://2"})
+
         test_cases = [
             {
                 "name": "Actual size doesn't match content size",
                 "entities": [
-                    DataEntity(
-                        uri="http://1",
-                        datetime=datetime,
-                        source=DataSource.REDDIT,
-                        label=default_label,
-                        content=b"123",
-                        content_size_bytes=3,
+                    default_entity.copy(
+                        update={"content": b"123", "content_size_bytes": 3}
                     ),
-                    DataEntity(
-                        uri="http://2",
-                        datetime=datetime,
-                        source=DataSource.REDDIT,
-                        label=default_label,
-                        content=b"123",
-                        content_size_bytes=200,  # Content size doesn't match the content
+                    second_entity.copy(
+                        update={
+                            "content": b"123",
+                            # Content size doesn't match the content
+                            "content_size_bytes": 200,
+                        }
                     ),
                 ],
                 "data_entity_bucket": default_data_entity_bucket,
@@ -176,21 +237,11 @@ class TestValiUtils(unittest.TestCase):
             {
                 "name": "Actual size less than bucket summary",
                 "entities": [
-                    DataEntity(
-                        uri="http://1",
-                        datetime=datetime,
-                        source=DataSource.REDDIT,
-                        label=default_label,
-                        content=b"123",
-                        content_size_bytes=3,
+                    default_entity.copy(
+                        update={"content": b"123", "content_size_bytes": 3}
                     ),
-                    DataEntity(
-                        uri="http://2",
-                        datetime=datetime,
-                        source=DataSource.REDDIT,
-                        label=default_label,
-                        content=b"123",
-                        content_size_bytes=3,
+                    second_entity.copy(
+                        update={"content": b"123", "content_size_bytes": 3}
                     ),
                 ],
                 "data_entity_bucket": default_data_entity_bucket,
@@ -199,22 +250,9 @@ class TestValiUtils(unittest.TestCase):
             {
                 "name": "Label doesn't match bucket summary",
                 "entities": [
-                    DataEntity(
-                        uri="http://1",
-                        datetime=datetime,
-                        source=DataSource.REDDIT,
-                        # No label
-                        content=b"12345",
-                        content_size_bytes=5,
-                    ),
-                    DataEntity(
-                        uri="http://2",
-                        datetime=datetime,
-                        source=DataSource.REDDIT,
-                        label=default_label,
-                        content=b"12345",
-                        content_size_bytes=5,
-                    ),
+                    # No label
+                    default_entity.copy(update={"label": None}),
+                    second_entity,
                 ],
                 "data_entity_bucket": default_data_entity_bucket,
                 "expected_error": "Entity label",
@@ -222,22 +260,8 @@ class TestValiUtils(unittest.TestCase):
             {
                 "name": "DataSource doesn't match",
                 "entities": [
-                    DataEntity(
-                        uri="http://1",
-                        datetime=datetime,
-                        source=DataSource.REDDIT,
-                        label=default_label,
-                        content=b"12345",
-                        content_size_bytes=5,
-                    ),
-                    DataEntity(
-                        uri="http://2",
-                        datetime=datetime,
-                        source=DataSource.X,
-                        label=default_label,
-                        content=b"12345",
-                        content_size_bytes=5,
-                    ),
+                    default_entity,
+                    second_entity.copy(update={"source": DataSource.X}),
                 ],
                 "data_entity_bucket": default_data_entity_bucket,
                 "expected_error": "Entity source",
@@ -245,22 +269,10 @@ class TestValiUtils(unittest.TestCase):
             {
                 "name": "Datetime before time_bucket",
                 "entities": [
-                    DataEntity(
-                        uri="http://1",
-                        datetime=datetime - dt.timedelta(hours=1),
-                        source=DataSource.REDDIT,
-                        label=default_label,
-                        content=b"12345",
-                        content_size_bytes=5,
-                    ),
-                    DataEntity(
-                        uri="http://2",
-                        datetime=datetime,
-                        source=DataSource.REDDIT,
-                        label=default_label,
-                        content=b"12345",
-                        content_size_bytes=5,
+                    default_entity.copy(
+                        update={"datetime": datetime - dt.timedelta(hours=1)}
                     ),
+                    second_entity,
                 ],
                 "data_entity_bucket": default_data_entity_bucket,
                 "expected_error": "Entity datetime",
@@ -268,22 +280,10 @@ class TestValiUtils(unittest.TestCase):
             {
                 "name": "Datetime after time_bucket",
                 "entities": [
-                    DataEntity(
-                        uri="http://1",
-                        datetime=datetime + dt.timedelta(hours=1),
-                        source=DataSource.REDDIT,
-                        label=default_label,
-                        content=b"12345",
-                        content_size_bytes=5,
-                    ),
-                    DataEntity(
-                        uri="http://2",
-                        datetime=datetime,
-                        source=DataSource.REDDIT,
-                        label=default_label,
-                        content=b"12345",
-                        content_size_bytes=5,
+                    default_entity.copy(
+                        update={"datetime": datetime + dt.timedelta(hours=1)}
                     ),
+                    second_entity,
                 ],
                 "data_entity_bucket": default_data_entity_bucket,
                 "expected_error": "Entity datetime",
@@ -304,7 +304,7 @@ class TestValiUtils(unittest.TestCase):
         label = DataLabel(value="label")
         data_entity_bucket = DataEntityBucket(
             id=DataEntityBucketId(
-                time_bucket=TimeBucket.from_datetime(datetime),
+                time_bucket=_time_bucket(datetime),
                 source=DataSource.REDDIT,
                 label=label,
             ),
@@ -339,7 +339,7 @@ class TestValiUtils(unittest.TestCase):
         label = DataLabel(value="label")
         data_entity_bucket = DataEntityBucket(
             id=DataEntityBucketId(
-                time_bucket=TimeBucket.from_datetime(datetime),
+                time_bucket=_time_bucket(datetime),
                 source=DataSource.REDDIT,
                 label=label,
             ),
@@ -373,7 +373,7 @@ class TestValiUtils(unittest.TestCase):
         label = DataLabel(value="label")
         data_entity_bucket = DataEntityBucket(
             id=DataEntityBucketId(
-                time_bucket=TimeBucket.from_datetime(datetime_utc),
+                time_bucket=_time_bucket(datetime_utc),
                 source=DataSource.REDDIT,
                 label=label,
             ),
@@ -3,23 +3,45 @@ import sqlite3
 
 # 连接到SQLite数据库，如果文件不存在则会创建
 conn = sqlite3.connect('SqliteMinerStorage.sqlite')
-cursor = conn.cursor()
 
-cursor.execute("SELECT SUM(contentSizeBytes),label FROM DataEntity where source=1 group by label")
-rows = cursor.fetchall()
-for row in rows:
-    cursor.execute(f"UPDATE ScrapyConfig SET bytes = ? WHERE label = ?", (row[0], row[1]))
-
-cursor.execute("SELECT SUM(contentSizeBytes) FROM DataEntity")
-all_bytes = cursor.fetchone()[0]
-
-cursor.execute("SELECT SUM(bytes) FROM ScrapyConfig")
-config_bytes = cursor.fetchone()[0]
-
-cursor.execute("REPLACE INTO ScrapyConfig VALUES (?,?,?,?,?,?,?,?)", ('', 0,0,0,0,0,'2024-05-15 01:22:37+00:00', all_bytes-config_bytes))
-
-# 提交事务
-conn.commit()
+# 用 with conn: 管理事务：成功自动提交一次，出错自动回滚
+with conn:
+    cursor = conn.cursor()
+
+    # 批量更新前先设置 PRAGMA，减少日志和刷盘开销
+    cursor.executescript("""
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    """)
+
+    # 为聚合建立覆盖索引：source 过滤、label 分组、contentSizeBytes 求和都走索引
+    cursor.execute("""
+    CREATE INDEX IF NOT EXISTS data_entity_source_label_size_index
+    ON DataEntity (source, label, contentSizeBytes)
+    """)
+
+    # 用一条 UPDATE ... FROM 语句完成按 label 聚合和更新，不再逐行往返
+    try:
+        cursor.execute("""
+        UPDATE ScrapyConfig
+        SET bytes = src.total
+        FROM (SELECT label, SUM(contentSizeBytes) AS total FROM DataEntity WHERE source=1 GROUP BY label) AS src
+        WHERE ScrapyConfig.label = src.label
+        """)
+    except sqlite3.OperationalError:
+        # 旧版 SQLite（<3.33）不支持 UPDATE ... FROM，退回 executemany 复用同一条预编译语句
+        cursor.execute("SELECT SUM(contentSizeBytes),label FROM DataEntity where source=1 group by label")
+        cursor.executemany("UPDATE ScrapyConfig SET bytes = ? WHERE label = ?", cursor.fetchall())
+
+    # 一次查询同时取两张表的总量
+    cursor.execute("""
+    SELECT (SELECT SUM(contentSizeBytes) FROM DataEntity),
+           (SELECT SUM(bytes) FROM ScrapyConfig)
+    """)
+    all_bytes, config_bytes = cursor.fetchone()
+
+    cursor.execute("REPLACE INTO ScrapyConfig VALUES (?,?,?,?,?,?,?,?)", ('', 0,0,0,0,0,'2024-05-15 01:22:37+00:00', all_bytes-config_bytes))
 
 # 关闭连接
 conn.close()
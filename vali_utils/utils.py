@@ -1,5 +1,8 @@
 import bittensor as bt
 import hashlib
+import heapq
+import itertools
+import numpy
 import random
 from typing import List, Optional, Tuple, Type, Union
 import datetime as dt
@@ -21,48 +24,56 @@ def choose_data_entity_bucket_to_query(index: ScorableMinerIndex) -> DataEntityB
     The random selection is done based on choosing a random scorable byte in the total index to query, and then
     selecting that DataEntityBucket.
     """
-    total_size = sum(
-        scorable_bucket.scorable_bytes
-        for scorable_bucket in index.scorable_data_entity_buckets
+    # One cumulative sum plus a C-implemented weighted draw replaces the linear scan
+    # that re-summed scorable bytes on every draw.
+    cumulative_bytes = list(
+        itertools.accumulate(
+            scorable_bucket.scorable_bytes
+            for scorable_bucket in index.scorable_data_entity_buckets
+        )
     )
-    chosen_byte = random.uniform(0, total_size)
-    iterated_bytes = 0
-    for scorable_bucket in index.scorable_data_entity_buckets:
-        if iterated_bytes + scorable_bucket.scorable_bytes >= chosen_byte:
-            return scorable_bucket.to_data_entity_bucket()
-        iterated_bytes += scorable_bucket.scorable_bytes
     assert (
-        False
+        cumulative_bytes
     ), "Failed to choose a DataEntityBucket to query... which should never happen"
 
+    # New miners start at 0 credibility, so every bucket in their index has 0 scorable
+    # bytes. random.choices rejects an all-zero weighting, so fall back to the first
+    # bucket (matching the pre-weighted-draw behavior) to keep querying them.
+    if cumulative_bytes[-1] <= 0:
+        return index.scorable_data_entity_buckets[0].to_data_entity_bucket()
+
+    chosen_bucket = random.choices(
+        index.scorable_data_entity_buckets, cum_weights=cumulative_bytes, k=1
+    )[0]
+    return chosen_bucket.to_data_entity_bucket()
+
 
 def choose_entities_to_verify(entities: List[DataEntity]) -> List[DataEntity]:
     """Given a list of DataEntities from a DataEntityBucket, chooses a random set of entities to verify."""
 
     # For now, we just sample 2 entities, based on size. Ensure we choose different entities.
     # In future, consider sampling every N bytes.
-    chosen_entities = []
-    total_size = sum(entity.content_size_bytes for entity in entities)
-
-    # Ensure we don't try to choose more entities than exist to choose from.
+    #
+    # This uses Efraimidis-Spirakis weighted reservoir sampling (algorithm A-Res): each
+    # entity gets the key u^(1/weight) for u drawn uniformly from [0, 1), and the k
+    # largest keys form a size-weighted sample without replacement with the same
+    # distribution as sequential weighted draws, in one pass instead of k scans.
     num_entities_to_choose = min(2, len(entities))
-    for _ in range(num_entities_to_choose):
-        chosen_byte = random.uniform(0, total_size)
-        iterated_bytes = 0
-        for entity in entities:
-            if entity in chosen_entities:
-                # Ensure we skip over already chosen entities if we see them again.
-                continue
-
-            if iterated_bytes + entity.content_size_bytes >= chosen_byte:
-                chosen_entities.append(entity)
-                # Adjust total_size to account for the entity we already selected.
-                total_size -= entity.content_size_bytes
-                break
-
-            iterated_bytes += entity.content_size_bytes
+    keyed_entities = heapq.nlargest(
+        num_entities_to_choose,
+        (
+            (
+                random.random() ** (1.0 / entity.content_size_bytes)
+                if entity.content_size_bytes > 0
+                else 0.0,
+                entity,
+            )
+            for entity in entities
+        ),
+        key=lambda keyed_entity: keyed_entity[0],
+    )
 
-    return chosen_entities
+    return [entity for _, entity in keyed_entities]
 
 
 def are_entities_valid(
@@ -75,24 +86,51 @@ def are_entities_valid(
     """
 
     # Check the entity size, labels, source, and timestamp.
-    actual_size = 0
-    claimed_size = 0
+    # The sizes are gathered into numpy arrays and summed in C, which avoids
+    # accumulating thousands of small Python ints per validation round.
+    actual_size = int(
+        numpy.fromiter(
+            (len(entity.content or b"") for entity in entities), dtype=numpy.int64
+        ).sum()
+    )
+    claimed_size = int(
+        numpy.fromiter(
+            (entity.content_size_bytes for entity in entities), dtype=numpy.int64
+        ).sum()
+    )
+    if actual_size < claimed_size or actual_size < data_entity_bucket.size_bytes:
+        return (
+            False,
+            f"Size not as expected. Actual={actual_size}. Claimed={claimed_size}. Expected={data_entity_bucket.size_bytes}",
+        )
+
+    # The expected values are resolved from the bucket once up front; pydantic attribute
+    # access is too expensive to repeat per entity. The per-entity checks run cheapest
+    # first (int compare, then string compare, then datetime handling) and return on the
+    # first failure, so the common adversarial case pays as little as possible.
+    expected_source = data_entity_bucket.id.source
+    expected_label = data_entity_bucket.id.label
+    expected_label_value = expected_label.value if expected_label else None
     expected_datetime_range: DateRange = TimeBucket.to_date_range(
         data_entity_bucket.id.time_bucket
     )
 
     for entity in entities:
-        actual_size += len(entity.content or b"")
-        claimed_size += entity.content_size_bytes
-        if entity.source != data_entity_bucket.id.source:
+        if entity.source != expected_source:
             return (
                 False,
-                f"Entity source {entity.source} does not match data_entity_bucket source {data_entity_bucket.id.source}",
+                f"Entity source {entity.source} does not match data_entity_bucket source {expected_source}",
             )
-        if entity.label != data_entity_bucket.id.label:
+
+        # Compare the raw label values so a match costs one string compare rather than
+        # a field-by-field pydantic model comparison.
+        entity_label = entity.label
+        if (
+            entity_label.value if entity_label else None
+        ) != expected_label_value:
             return (
                 False,
-                f"Entity label {entity.label} does not match data_entity_bucket label {data_entity_bucket.id.label}",
+                f"Entity label {entity_label} does not match data_entity_bucket label {expected_label}",
             )
 
         tz_datetime = entity.datetime
@@ -106,12 +144,6 @@ def are_entities_valid(
                 f"Entity datetime {entity.datetime} is not in the expected range {expected_datetime_range}",
             )
 
-    if actual_size < claimed_size or actual_size < data_entity_bucket.size_bytes:
-        return (
-            False,
-            f"Size not as expected. Actual={actual_size}. Claimed={claimed_size}. Expected={data_entity_bucket.size_bytes}",
-        )
-
     return (True, "")
 
 
@@ -130,7 +162,9 @@ def are_entities_unique(entities: List[DataEntity]) -> bool:
     uris = set()
 
     for entity in entities:
-        entity_content_hash = hashlib.sha1(entity.content).hexdigest()
+        # The raw digest is enough for set membership; hex encoding it doubles the
+        # bytes hashed and stored per entity for no benefit.
+        entity_content_hash = hashlib.sha1(entity.content).digest()
         # Check that this hash has not been seen before.
         if entity_content_hash in entity_content_hash_set or entity.uri in uris:
             return False